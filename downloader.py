@@ -5,6 +5,8 @@ Uses the official asf_search library with proper ASFSession authentication
 """
 
 import os
+import sys
+import ctypes
 import logging
 import asyncio
 import json
@@ -12,7 +14,18 @@ from datetime import datetime
 from pathlib import Path
 import zipfile
 import shutil
-from typing import Dict, List, Optional
+import struct
+import zlib
+import mmap
+import re
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+# KEY=value lines; comments and blank lines never match
+_ENV_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
 
 # FORCE load environment variables from .env file
 def load_env_file():
@@ -20,12 +33,10 @@ def load_env_file():
     env_path = Path('.env')
     if env_path.exists():
         print(f"Loading .env from: {env_path.absolute()}")
-        with open(env_path) as f:
-            for line in f:
-                if '=' in line and not line.strip().startswith('#'):
-                    key, value = line.strip().split('=', 1)
-                    os.environ[key] = value
-                    print(f"Set {key}={'***' if 'TOKEN' in key or 'PASSWORD' in key else value}")
+        data = env_path.read_text(encoding='utf-8', errors='replace')
+        parsed = dict(_ENV_RE.findall(data))
+        os.environ.update(parsed)
+        print(f"Set {len(parsed)} variables from .env")
     else:
         print(f"No .env file found at: {env_path.absolute()}")
 
@@ -48,22 +59,174 @@ except ImportError:
     print("❌ asf_search not available - install with: pip install asf-search")
     exit(1)
 
-logging.basicConfig(level=logging.INFO)
+# Optional: stream-unzip for extracting while downloading (--stream)
+try:
+    from stream_unzip import stream_unzip
+except ImportError:
+    stream_unzip = None
+
+# Optional: ISA-L's SIMD inflate and CRC-32 (typically 2-3x stock zlib) for extraction.
+# Only this module's extractor uses it; zipfile itself is left untouched
+_crc32 = zlib.crc32
+try:
+    from isal import isal_zlib
+    _crc32 = isal_zlib.crc32
+except ImportError:
+    isal_zlib = None
+
+# Optional: orjson parses metadata JSON several times faster than the stdlib
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Authenticated session cookies are reused across CLI runs for this long
+SESSION_CACHE_PATH = Path.home() / ".cache" / "sar_ct" / "asf_session.json"
+SESSION_CACHE_TTL = 3600  # seconds
+
+# Linux fallocate(2) via libc: unlike posix_fallocate, glibc doesn't emulate it by
+# writing zeros when the filesystem lacks support, it just fails with EOPNOTSUPP
+_fallocate = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(None, use_errno=True)
+        # musl dropped the *64 aliases; its fallocate already takes a 64-bit off_t
+        _fallocate = getattr(_libc, 'fallocate64', None) or _libc.fallocate
+        _fallocate.argtypes = (ctypes.c_int, ctypes.c_int, ctypes.c_int64, ctypes.c_int64)
+        _fallocate.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _fallocate = None
+
+def _is_auth_failure(error: Exception) -> bool:
+    """Whether an HTTP error (requests.HTTPError from raise_for_status) is a 401/403"""
+    response = getattr(error, 'response', None)
+    return getattr(response, 'status_code', None) in (401, 403)
+
+def _preallocate(fd: int, size: int):
+    """Reserve a file's full size up front so the filesystem can pick contiguous extents"""
+    if size <= 0:
+        return
+    if _fallocate is not None:
+        # A failure means no native support - plain writes still work
+        _fallocate(fd, 0, 0, size)
+    elif not sys.platform.startswith('linux') and hasattr(os, 'posix_fallocate'):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass
+
+# Only members at least this large (the measurement TIFFs) are synced and dropped
+# from the page cache; syncing every small XML would stall the extraction workers
+PAGE_CACHE_DROP_MIN_SIZE = 64 << 20
+
+def _drop_page_cache(fd: int, size: int):
+    """Write back a large finished file and release its cached pages"""
+    if size >= PAGE_CACHE_DROP_MIN_SIZE and hasattr(os, 'posix_fadvise'):
+        # DONTNEED can't drop dirty pages, so flush them to disk first
+        os.fdatasync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+# 4 MiB copy buffer - ZipFile.extract's default 8 KiB means millions of writes per TIFF
+EXTRACT_BUFFER_SIZE = 4 << 20
+
+# Sentinel-1 measurement names carry the polarization as a "-vv-" style token
+_POL_RE = re.compile(r'-(vv|vh|hh|hv)-', re.IGNORECASE)
+
+def _polarization(filename: str) -> Optional[str]:
+    """Polarization token of a measurement filename, e.g. 'VV'"""
+    match = _POL_RE.search(filename)
+    return match.group(1).upper() if match else None
+
+def _new_safe_stats() -> Dict:
+    """Empty SAFE structure report.
+    
+    dirs: top-level directory -> direct child count, files: top-level file names,
+    tiffs: (polarization, path, size) for each measurement TIFF.
+    """
+    return {'dirs': {}, 'files': set(), 'tiffs': []}
+
+def _record_safe_member(stats: Dict, safe_path: Path, relative: str, size: int):
+    """Fold one SAFE member (path relative to the SAFE root) into a structure report"""
+    is_dir = relative.endswith('/')
+    parts = relative.rstrip('/').split('/')
+    if not parts[0]:
+        return  # the SAFE root itself
+    
+    top = parts[0]
+    if len(parts) == 1:
+        if is_dir:
+            stats['dirs'].setdefault(top, 0)
+        else:
+            stats['files'].add(top)
+        return
+    
+    stats['dirs'][top] = stats['dirs'].get(top, 0) + (len(parts) == 2)
+    
+    if top == 'measurement' and len(parts) == 2 and not is_dir and parts[1].endswith('.tiff'):
+        stats['tiffs'].append((_polarization(parts[1]), safe_path / relative, size))
+
+def _scan_safe(safe_path: Path) -> Dict:
+    """Build a SAFE structure report from what is on disk"""
+    stats = _new_safe_stats()
+    with os.scandir(safe_path) as it:
+        for entry in it:
+            if not entry.is_dir():
+                stats['files'].add(entry.name)
+                continue
+            
+            with os.scandir(entry.path) as sub:
+                children = list(sub)
+            stats['dirs'][entry.name] = len(children)
+            
+            if entry.name == 'measurement':
+                stats['tiffs'] = [
+                    (_polarization(child.name), Path(child.path), child.stat().st_size)
+                    for child in children if child.name.endswith('.tiff')
+                ]
+    return stats
+
 class ASFOfficialDownloader:
     """ASF downloader using the official asf_search library"""
     
-    def __init__(self, download_dir: Path = Path("./sar_data")):
+    def __init__(self, download_dir: Path = Path("./sar_data"), stream: bool = False,
+                 parallel_parts: int = 1, trust_zip: bool = False):
         self.download_dir = Path(download_dir)
         self.raw_dir = self.download_dir / "raw_zip"
         self.safe_dir = self.download_dir / "safe_extracted" 
         self.session = None
         
+        # SAFE structure reports keyed by SAFE path, filled during extraction
+        self._safe_stats: Dict[str, Dict] = {}
+        
+        # Ranged connections per scene (1 = single-stream asf_search download)
+        self.parallel_parts = max(1, parallel_parts)
+        
+        # Trusting the ZIP skips CRC-32 checks during extraction: a corrupt archive
+        # extracts silently, so only use it when HTTPS transport is trusted and the
+        # SAFE is verified afterwards
+        self.trust_zip = trust_zip
+        if self.trust_zip:
+            print("⚠️  --trust-zip: ZIP CRC-32 integrity checks are disabled")
+        
+        # Streaming mode extracts while downloading and skips the ZIP staging dir
+        self.stream = stream
+        if self.stream and stream_unzip is None:
+            print("⚠️  stream-unzip not available - install with: pip install stream-unzip")
+            print("   Falling back to ZIP download + extraction")
+            self.stream = False
+        
         # Create directories
-        self.raw_dir.mkdir(parents=True, exist_ok=True)
+        if not self.stream:
+            self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.safe_dir.mkdir(parents=True, exist_ok=True)
         
+        # Finish deleting any SAFE trees a previous run moved aside but didn't remove
+        for stale in self.safe_dir.glob(".*.old.*"):
+            self._discard_tree(stale)
+        
         # Get authentication credentials
         self.edl_token = os.getenv('EDL_TOKEN')
         self.username = os.getenv('ASF_USERNAME') 
@@ -95,16 +258,24 @@ class ASFOfficialDownloader:
         print("\nRegister at: https://urs.earthdata.nasa.gov/")
         print("="*60)
     
-    def authenticate(self) -> bool:
-        """Authenticate using ASF's official methods"""
+    def authenticate(self, use_cache: bool = True) -> bool:
+        """Authenticate using ASF's official methods (use_cache=False forces a real login)"""
         print(f"\n🔐 Starting ASF authentication...")
         
+        # Warm start: reuse cookies from a recent run and skip the URS round-trip
+        cached_session = self._load_cached_session() if use_cache else None
+        if cached_session is not None:
+            self.session = cached_session
+            print("✅ Reusing cached ASF session")
+            return True
+        
         try:
             # Try token authentication first
             if self.edl_token:
                 print("🔑 Authenticating with EDL token...")
                 self.session = asf.ASFSession().auth_with_token(self.edl_token)
                 print("✅ Token authentication successful!")
+                self._save_session_cache()
                 return True
             
             # Fall back to username/password
@@ -113,6 +284,7 @@ class ASFOfficialDownloader:
                 print(f"   Username: {self.username}")
                 self.session = asf.ASFSession().auth_with_creds(self.username, self.password)
                 print("✅ Credentials authentication successful!")
+                self._save_session_cache()
                 return True
             
             else:
@@ -127,6 +299,76 @@ class ASFOfficialDownloader:
             print(f"❌ Authentication error: {e}")
             return False
     
+    def _session_identity(self) -> Optional[str]:
+        """Fingerprint of the configured account, so a cache never crosses accounts"""
+        # Tokens are high-entropy, so a plain digest is safe to store; passwords
+        # are not, so username/password logins are identified by username only
+        if self.edl_token:
+            identity = f"token:{self.edl_token}"
+        elif self.username:
+            identity = f"user:{self.username}"
+        else:
+            return None
+        return hashlib.sha256(identity.encode()).hexdigest()
+    
+    def _load_cached_session(self):
+        """Rebuild an ASFSession from cached cookies, or None if missing/stale"""
+        try:
+            if time.time() - SESSION_CACHE_PATH.stat().st_mtime > SESSION_CACHE_TTL:
+                return None
+            cache = json.loads(SESSION_CACHE_PATH.read_text())
+            if cache.get('identity') != self._session_identity():
+                return None
+            
+            # Restore each cookie with its scope so auth cookies are only sent
+            # to the hosts that issued them (never to the S3 redirect target)
+            session = asf.ASFSession()
+            for cookie in cache['cookie_jar']:
+                if cookie['expires'] is not None and cookie['expires'] <= time.time():
+                    continue
+                session.cookies.set(
+                    cookie['name'], cookie['value'],
+                    domain=cookie['domain'], path=cookie['path'],
+                    secure=cookie['secure'], expires=cookie['expires'],
+                    rest={'HttpOnly': None} if cookie['http_only'] else {}
+                )
+            if self.edl_token:
+                session.headers.update({'Authorization': f'Bearer {self.edl_token}'})
+            return session
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+    
+    def _save_session_cache(self):
+        """Persist the authenticated session cookies for the next run"""
+        identity = self._session_identity()
+        if self.session is None or identity is None:
+            return
+        try:
+            SESSION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(SESSION_CACHE_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w') as f:
+                json.dump({
+                    'identity': identity,
+                    'cookie_jar': [
+                        {
+                            'name': cookie.name,
+                            'value': cookie.value,
+                            'domain': cookie.domain,
+                            'path': cookie.path,
+                            'secure': cookie.secure,
+                            'expires': cookie.expires,
+                            'http_only': cookie.has_nonstandard_attr('HttpOnly'),
+                        }
+                        for cookie in self.session.cookies
+                    ],
+                }, f)
+        except OSError as e:
+            logger.warning("Could not cache ASF session: %s", e)
+    
+    def _clear_session_cache(self):
+        """Drop cached cookies so the next run performs a full authentication"""
+        SESSION_CACHE_PATH.unlink(missing_ok=True)
+    
     def download_scene_with_progress(self, scene_metadata: Dict) -> Optional[Path]:
         """Download and extract a SAR scene using ASF's official library"""
         
@@ -134,119 +376,386 @@ class ASFOfficialDownloader:
         url = scene_metadata['url']
         size_mb = scene_metadata.get('size_mb', 0)
         
-        print(f"\n🚀 DOWNLOADING: {granule_name}")
-        print(f"📦 Size: {size_mb:.1f} MB ({size_mb/1024:.1f} GB)")
-        print(f"🔗 URL: {url}")
+        logger.info("Downloading %s (%.1f MB) from %s", granule_name, size_mb, url)
         
         # Check if SAFE already exists
         safe_path = self.safe_dir / f"{granule_name}.SAFE"
         if safe_path.exists():
-            print(f"✅ SAFE already exists: {safe_path}")
+            logger.info("SAFE already exists: %s", safe_path)
             return safe_path
         
+        if self.stream:
+            return self.download_scene_streaming(granule_name, url)
+        
         # Check if ZIP already exists
         zip_path = self.raw_dir / f"{granule_name}.zip"
         if zip_path.exists():
-            print(f"✅ ZIP already exists, extracting...")
+            logger.info("ZIP already exists, extracting %s", zip_path.name)
             return self.extract_safe_optimized(zip_path)
         
         try:
-            # Download using ASF's official method
-            print(f"⬇️  Starting download with asf_search...")
             start_time = datetime.now()
             
-            # Download to raw directory
-            asf.download_urls(
-                urls=[url], 
-                path=str(self.raw_dir),
-                session=self.session
-            )
+            # Multi-connection ranged download, falling back to the official method
+            downloaded = False
+            if self.parallel_parts > 1:
+                logger.info("Starting download with %d parallel connections", self.parallel_parts)
+                downloaded = self.download_scene_parallel(url, zip_path, self.parallel_parts)
+            
+            if not downloaded:
+                # Download using ASF's official method
+                logger.info("Starting download with asf_search")
+                
+                # Download to raw directory
+                asf.download_urls(
+                    urls=[url], 
+                    path=str(self.raw_dir),
+                    session=self.session
+                )
             
             total_time = (datetime.now() - start_time).total_seconds()
-            print(f"✅ Download complete in {total_time:.1f}s")
+            logger.info("Download complete in %.1fs", total_time)
             
             # Verify the download
             if zip_path.exists():
                 actual_size = zip_path.stat().st_size / (1024**2)  # MB
-                print(f"📊 Downloaded size: {actual_size:.1f} MB")
+                logger.info("Downloaded size: %.1f MB", actual_size)
                 
                 # Extract SAFE
-                print(f"📂 Extracting SAFE directory...")
                 extracted_safe = self.extract_safe_optimized(zip_path)
                 
                 if extracted_safe:
-                    print(f"🎯 SAFE ready: {extracted_safe}")
-                    
-                    # Show analysis-ready files
-                    measurement_files = self.get_measurement_files(extracted_safe)
-                    print(f"📡 Ready for analysis:")
-                    for pol, file_path in measurement_files.items():
-                        file_size = file_path.stat().st_size / (1024**2)  # MB
-                        print(f"   {pol}: {file_path.name} ({file_size:.0f} MB)")
-                    
+                    logger.info("SAFE ready: %s", extracted_safe)
+                    self._show_measurement_files(extracted_safe)
                     return extracted_safe
                 else:
-                    print("❌ SAFE extraction failed")
+                    logger.error("SAFE extraction failed")
                     return None
             else:
-                print("❌ Download failed - file not found")
+                logger.error("Download failed - file not found")
                 return None
                 
         except asf.ASFAuthenticationError as e:
-            print(f"❌ Authentication error during download: {e}")
-            print("💡 Your token may have expired or credentials are invalid")
+            logger.error("Authentication error during download: %s "
+                         "(token may have expired or credentials are invalid)", e)
+            self._clear_session_cache()
             return None
         except Exception as e:
-            print(f"❌ Download error: {e}")
+            logger.error("Download error: %s", e)
+            if _is_auth_failure(e):
+                self._clear_session_cache()
             return None
     
+    def download_scene_parallel(self, url: str, dest: Path, n: int = 4) -> bool:
+        """Download one file over n ranged connections; False if ranges aren't usable"""
+        if not hasattr(os, 'pwrite'):
+            return False
+        
+        part_path = dest.with_name(dest.name + '.part')
+        
+        try:
+            head = self.session.head(url, allow_redirects=True, timeout=(10, 60))
+            head.raise_for_status()
+            size = int(head.headers.get('Content-Length', 0))
+            if size <= 0 or head.headers.get('Accept-Ranges', '').lower() != 'bytes':
+                logger.warning("Server does not advertise byte ranges - using single stream")
+                return False
+            
+            n = max(1, min(n, size))
+            part_size = -(-size // n)  # ceiling division
+            ranges = [(lo, min(lo + part_size, size) - 1) for lo in range(0, size, part_size)]
+            
+            fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.ftruncate(fd, size)
+                
+                def fetch_range(byte_range: Tuple[int, int]) -> int:
+                    lo, hi = byte_range
+                    headers = {'Range': f'bytes={lo}-{hi}'}
+                    with self.session.get(url, headers=headers, stream=True, timeout=(10, 300)) as r:
+                        if r.status_code != 206:
+                            raise RuntimeError(f"range request returned HTTP {r.status_code}")
+                        offset = lo
+                        for chunk in r.iter_content(chunk_size=1 << 20):
+                            os.pwrite(fd, chunk, offset)
+                            offset += len(chunk)
+                    return offset - lo
+                
+                with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                    received = sum(executor.map(fetch_range, ranges))
+            finally:
+                os.close(fd)
+            
+            if received != size:
+                raise RuntimeError(f"received {received} of {size} bytes")
+            
+            part_path.replace(dest)
+            return True
+            
+        except Exception as e:
+            logger.warning("Parallel download failed (%s) - using single stream", e)
+            part_path.unlink(missing_ok=True)
+            return False
+    
+    def download_scene_streaming(self, granule_name: str, url: str) -> Optional[Path]:
+        """Download a scene and extract the SAFE as the ZIP bytes arrive"""
+        staging_dir = self.safe_dir / f".{granule_name}.partial"
+        
+        try:
+            logger.info("Streaming download + extraction")
+            start_time = datetime.now()
+            
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+            staging_dir.mkdir(parents=True)
+            
+            safe_name = None
+            file_count = 0
+            stats = _new_safe_stats()
+            
+            # ASFSession carries the EDL auth across the redirect to the data host
+            with self.session.get(url, stream=True, timeout=(10, 300)) as response:
+                response.raise_for_status()
+                zipped_chunks = response.iter_content(chunk_size=1 << 20)
+                
+                for file_name, file_size, unzipped_chunks in stream_unzip(zipped_chunks):
+                    name = file_name.decode('utf-8')
+                    
+                    if safe_name is None and '.SAFE/' in name:
+                        safe_name = name[:name.index('.SAFE/') + len('.SAFE')]
+                        logger.info("Found: %s", safe_name)
+                    
+                    # Chunks must always be drained, even for skipped entries
+                    if safe_name is None or not name.startswith(safe_name) or name.endswith('/'):
+                        for _ in unzipped_chunks:
+                            pass
+                        if safe_name is not None and name.startswith(safe_name):
+                            _record_safe_member(stats, self.safe_dir / safe_name,
+                                                name[len(safe_name) + 1:], 0)
+                        continue
+                    
+                    dest = (staging_dir / name).resolve()
+                    if staging_dir.resolve() not in dest.parents:
+                        raise ValueError(f"Unsafe path in ZIP: {name}")
+                    
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    written = 0
+                    with open(dest, 'wb') as f:
+                        for chunk in unzipped_chunks:
+                            f.write(chunk)
+                            written += len(chunk)
+                    file_count += 1
+                    _record_safe_member(stats, self.safe_dir / safe_name,
+                                        name[len(safe_name) + 1:], written)
+            
+            total_time = (datetime.now() - start_time).total_seconds()
+            logger.info("Streamed %d files in %.1fs", file_count, total_time)
+            
+            if safe_name is None:
+                logger.error("No .SAFE directory found in ZIP")
+                return None
+            
+            # Move the completed SAFE into place - partial downloads never look finished
+            final_safe = self.safe_dir / safe_name
+            if final_safe.exists():
+                self._discard_tree(final_safe)
+            (staging_dir / safe_name).rename(final_safe)
+            self._safe_stats[str(final_safe)] = stats
+            
+            # CRCs were checked by stream-unzip; verify the SAFE structure as well
+            if not self.verify_safe_comprehensive(final_safe, stats):
+                logger.error("SAFE verification failed")
+                return None
+            
+            logger.info("SAFE ready: %s", final_safe)
+            self._show_measurement_files(final_safe)
+            return final_safe
+            
+        except asf.ASFAuthenticationError as e:
+            logger.error("Authentication error during download: %s "
+                         "(token may have expired or credentials are invalid)", e)
+            self._clear_session_cache()
+            return None
+        except Exception as e:
+            logger.error("Streaming download error: %s", e)
+            # A stale cached session surfaces here as an HTTP 401/403
+            if _is_auth_failure(e):
+                self._clear_session_cache()
+            return None
+        finally:
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir, ignore_errors=True)
+    
     def extract_safe_optimized(self, zip_path: Path) -> Optional[Path]:
         """Optimized SAFE extraction with verification"""
         try:
-            print(f"📂 Extracting {zip_path.name}...")
+            logger.info("Extracting %s", zip_path.name)
             
             with zipfile.ZipFile(zip_path, 'r') as zf:
+                # Walk the central directory once; ZipInfo also carries sizes
+                members = zf.infolist()
+                
                 # Find SAFE directory
-                safe_entries = [name for name in zf.namelist() if name.endswith('.SAFE/')]
+                safe_name = next((m.filename[:-1] for m in members if m.filename.endswith('.SAFE/')), None)
                 
-                if not safe_entries:
-                    print("❌ No .SAFE directory found in ZIP")
+                if safe_name is None:
+                    logger.error("No .SAFE directory found in ZIP")
                     return None
                 
-                safe_name = safe_entries[0].rstrip('/')
-                print(f"📁 Found: {safe_name}")
+                logger.info("Found: %s", safe_name)
                 
                 # Extract directly to final location
                 final_safe = self.safe_dir / safe_name
                 
                 if final_safe.exists():
-                    print("🗑️  Removing existing SAFE directory")
-                    shutil.rmtree(final_safe)
+                    logger.info("Removing existing SAFE directory")
+                    self._discard_tree(final_safe)
                 
                 # Extract all SAFE contents
-                safe_members = [m for m in zf.namelist() if m.startswith(safe_name)]
+                safe_members = [m for m in members if m.filename.startswith(safe_name)]
                 
-                print(f"📦 Extracting {len(safe_members)} files...")
+                start_time = time.perf_counter()
                 
+                # Create the directory tree up front so workers never race on mkdir;
+                # the same pass builds the structure report used for verification
+                stats = _new_safe_stats()
+                file_members = []
                 for member in safe_members:
-                    zf.extract(member, self.safe_dir)
+                    _record_safe_member(stats, final_safe, member.filename[len(safe_name) + 1:],
+                                        member.file_size)
+                    member_path = self._member_path(member.filename)
+                    if member.is_dir():
+                        member_path.mkdir(parents=True, exist_ok=True)
+                    else:
+                        member_path.parent.mkdir(parents=True, exist_ok=True)
+                        file_members.append(member)
+                
+                # Largest first, dealt round-robin so shards carry similar bytes
+                file_members.sort(key=lambda m: m.file_size, reverse=True)
+                workers = max(1, min(os.cpu_count() or 1, len(file_members)))
+                shards = [file_members[i::workers] for i in range(workers)]
+                
+                # ZipFile objects aren't thread-safe - each worker opens its own
+                def extract_shard(shard: List[zipfile.ZipInfo]):
+                    with zipfile.ZipFile(zip_path, 'r') as worker_zf:
+                        for member in shard:
+                            self._extract_member(worker_zf, member)
+                
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(extract_shard, shards))
+                
+                self._safe_stats[str(final_safe)] = stats
                 
                 # Verify structure
-                if self.verify_safe_comprehensive(final_safe):
-                    print(f"✅ Extraction complete: {final_safe}")
+                if self.verify_safe_comprehensive(final_safe, stats):
+                    logger.info("Extracted %d files in %.1fs: %s", len(safe_members),
+                                time.perf_counter() - start_time, final_safe)
                     return final_safe
                 else:
-                    print("❌ SAFE verification failed")
+                    logger.error("SAFE verification failed")
                     return None
                     
         except Exception as e:
-            print(f"❌ Extraction error: {e}")
+            logger.error("Extraction error: %s", e)
             return None
     
-    def verify_safe_comprehensive(self, safe_path: Path) -> bool:
-        """Comprehensive SAFE verification"""
+    def _extract_member(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo):
+        """Extract one file member with large buffered writes"""
+        dest = self._member_path(info.filename)
+        
+        if info.compress_type == zipfile.ZIP_STORED and self._copy_stored_member(zf, info, dest):
+            return
+        
+        with zf.open(info, 'r') as src, open(dest, 'wb') as dst:
+            if isal_zlib is not None and info.compress_type == zipfile.ZIP_DEFLATED:
+                # Nothing has been read yet, so the inflater can still be swapped
+                src._decompressor = isal_zlib.decompressobj(-15)
+            if self.trust_zip:
+                # Per-file opt-out: ZipExtFile skips its CRC-32 when none is expected
+                src._expected_crc = None
+            _preallocate(dst.fileno(), info.file_size)
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(dst.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            shutil.copyfileobj(src, dst, length=EXTRACT_BUFFER_SIZE)
+            dst.flush()
+            _drop_page_cache(dst.fileno(), info.file_size)
+    
+    def _copy_stored_member(self, zf: zipfile.ZipFile, info: zipfile.ZipInfo, dest: Path) -> bool:
+        """Kernel-side copy of an uncompressed member; False if not supported here"""
+        if not hasattr(os, 'copy_file_range') or info.flag_bits & 0x1:
+            return False
+        
+        src_fd = zf.fp.fileno()
+        
+        # Data starts after the local header, whose name/extra lengths may differ from the central directory
+        header = os.pread(src_fd, 30, info.header_offset)
+        if len(header) != 30 or header[:4] != b'PK\x03\x04':
+            raise zipfile.BadZipFile(f"Bad local file header for {info.filename!r}")
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        src_offset = info.header_offset + 30 + name_len + extra_len
+        
+        with open(dest, 'wb') as dst:
+            copied = 0
+            try:
+                while copied < info.file_size:
+                    n = os.copy_file_range(src_fd, dst.fileno(), info.file_size - copied,
+                                           src_offset + copied, copied)
+                    if n == 0:
+                        raise zipfile.BadZipFile(f"Truncated data for {info.filename!r}")
+                    copied += n
+            except OSError:
+                # Cross-device or unsupported filesystem - the buffered path handles it
+                if copied:
+                    raise
+                return False
+            
+            if self.trust_zip:
+                _drop_page_cache(dst.fileno(), info.file_size)
+                return True
+        
+        # Keep zipfile's integrity guarantee: CRC the freshly written (page-cached) file
+        crc = 0
+        if info.file_size:
+            with open(dest, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    crc = _crc32(mm)
+                _drop_page_cache(f.fileno(), info.file_size)
+        if crc != info.CRC:
+            raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+        
+        return True
+    
+    def _discard_tree(self, path: Path):
+        """Move a directory tree aside and delete it in the background"""
+        if '.old.' in path.name:
+            doomed = path
+        else:
+            # Rename is one atomic syscall; the recursive unlink no longer blocks extraction
+            doomed = path.with_name(f".{path.name}.old.{os.getpid()}.{threading.get_ident()}")
+            os.rename(path, doomed)
+        threading.Thread(target=shutil.rmtree, args=(doomed,), kwargs={'ignore_errors': True},
+                         daemon=True).start()
+    
+    def _member_path(self, member: str) -> Path:
+        """Resolve a ZIP member to its destination, rejecting path traversal"""
+        member_path = (self.safe_dir / member).resolve()
+        if self.safe_dir.resolve() not in member_path.parents:
+            raise ValueError(f"Unsafe path in ZIP: {member}")
+        return member_path
+    
+    def _get_safe_stats(self, safe_path: Path) -> Dict:
+        """Structure report for a SAFE - from extraction if we made it, else scanned once"""
+        key = str(safe_path)
+        stats = self._safe_stats.get(key)
+        if stats is None:
+            stats = self._safe_stats[key] = _scan_safe(safe_path)
+        return stats
+    
+    def verify_safe_comprehensive(self, safe_path: Path, stats: Optional[Dict] = None) -> bool:
+        """Comprehensive SAFE verification over a structure report (no disk access if given)"""
         try:
-            print(f"🔍 Verifying SAFE structure...")
+            if stats is None:
+                stats = self._get_safe_stats(safe_path)
             
             # Required directories and files
             required_dirs = ['annotation', 'measurement', 'preview']
@@ -254,78 +763,58 @@ class ASFOfficialDownloader:
             
             # Check structure
             for dir_name in required_dirs:
-                dir_path = safe_path / dir_name
-                if not dir_path.exists():
-                    print(f"❌ Missing directory: {dir_name}")
+                if dir_name not in stats['dirs']:
+                    logger.error("Missing directory: %s", dir_name)
                     return False
                 
                 if dir_name == 'measurement':
-                    tiff_files = list(dir_path.glob("*.tiff"))
+                    tiff_files = stats['tiffs']
                     if not tiff_files:
-                        print(f"❌ No TIFF files in {dir_name}")
+                        logger.error("No TIFF files in %s", dir_name)
                         return False
-                    print(f"✅ {dir_name}: {len(tiff_files)} TIFF files")
+                    logger.debug("%s: %d TIFF files", dir_name, len(tiff_files))
                 else:
-                    file_count = len(list(dir_path.iterdir()))
-                    print(f"✅ {dir_name}: {file_count} files")
+                    logger.debug("%s: %d files", dir_name, stats['dirs'][dir_name])
             
             for file_name in required_files:
-                if not (safe_path / file_name).exists():
-                    print(f"❌ Missing file: {file_name}")
+                if file_name not in stats['files']:
+                    logger.error("Missing file: %s", file_name)
                     return False
             
             # Check polarizations
-            measurement_dir = safe_path / "measurement"
-            polarizations = set()
-            total_size_gb = 0
-            
-            for tiff_file in measurement_dir.glob("*.tiff"):
-                filename = tiff_file.name.lower()
-                size_gb = tiff_file.stat().st_size / (1024**3)
-                total_size_gb += size_gb
-                
-                if 'vv' in filename:
-                    polarizations.add('VV')
-                elif 'vh' in filename:
-                    polarizations.add('VH')
-                elif 'hh' in filename:
-                    polarizations.add('HH')
-                elif 'hv' in filename:
-                    polarizations.add('HV')
-            
-            print(f"✅ Polarizations: {sorted(polarizations)}")
-            print(f"✅ Total measurement data: {total_size_gb:.2f} GB")
-            print(f"✅ SAFE verification complete")
+            polarizations = {pol for pol, _, _ in tiff_files if pol}
+            total_size_gb = sum(size for _, _, size in tiff_files) / (1024**3)
+            
+            logger.info("SAFE verified: polarizations %s, %.2f GB measurement data",
+                        sorted(polarizations), total_size_gb)
             
             return len(polarizations) > 0
             
         except Exception as e:
-            print(f"❌ Verification error: {e}")
+            logger.error("Verification error: %s", e)
             return False
     
+    def _show_measurement_files(self, safe_path: Path):
+        """Print the analysis-ready measurement files of a SAFE"""
+        measurement_files = self.get_measurement_files(safe_path)
+        sizes = {path: size for _, path, size in self._get_safe_stats(safe_path)['tiffs']}
+        for pol, file_path in measurement_files.items():
+            logger.info("Ready for analysis - %s: %s (%.0f MB)", pol, file_path.name,
+                        sizes[file_path] / (1024**2))
+    
     def get_measurement_files(self, safe_path: Path) -> Dict[str, Path]:
         """Get measurement files organized by polarization"""
         measurement_files = {}
         
         try:
-            measurement_dir = safe_path / "measurement"
-            
-            for tiff_file in measurement_dir.glob("*.tiff"):
-                filename = tiff_file.name.lower()
-                
-                if 'vv' in filename:
-                    measurement_files['VV'] = tiff_file
-                elif 'vh' in filename:
-                    measurement_files['VH'] = tiff_file
-                elif 'hh' in filename:
-                    measurement_files['HH'] = tiff_file
-                elif 'hv' in filename:
-                    measurement_files['HV'] = tiff_file
+            for pol, tiff_file, _ in self._get_safe_stats(safe_path)['tiffs']:
+                if pol:
+                    measurement_files[pol] = tiff_file
             
             return measurement_files
             
         except Exception as e:
-            print(f"Error getting measurement files: {e}")
+            logger.error("Error getting measurement files: %s", e)
             return {}
 
 # CLI Usage
@@ -342,19 +831,35 @@ def main():
                        help='Maximum scenes to download')
     parser.add_argument('--check-auth', action='store_true',
                        help='Only check authentication, don\'t download')
+    parser.add_argument('--concurrency', type=int, default=4,
+                       help='Maximum scenes to download in parallel')
+    parser.add_argument('--stream', action='store_true',
+                       help='Extract the SAFE while downloading (no raw ZIP is kept)')
+    parser.add_argument('--parallel-parts', type=int, default=1,
+                       help='Ranged HTTP connections per scene (1 = single stream)')
+    parser.add_argument('--trust-zip', action='store_true',
+                       help='Skip ZIP CRC-32 checks during extraction (disables integrity checking)')
+    parser.add_argument('--quiet', action='store_true',
+                       help='Only log warnings and errors')
     
     args = parser.parse_args()
     
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO,
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    
     print("🔧 ASF Official Library Downloader")
     print("="*50)
     
     # Initialize downloader
-    downloader = ASFOfficialDownloader(args.download_dir)
+    downloader = ASFOfficialDownloader(args.download_dir, stream=args.stream,
+                                       parallel_parts=args.parallel_parts,
+                                       trust_zip=args.trust_zip)
     
     # Check authentication
     if args.check_auth:
         print("\n🔐 Testing ASF authentication...")
-        success = downloader.authenticate()
+        # Always contact URS here - a cached session says nothing about the credentials
+        success = downloader.authenticate(use_cache=False)
         if success:
             print("✅ ASF authentication successful!")
             
@@ -394,20 +899,28 @@ def main():
             print("❌ ASF authentication failed - cannot download")
             return
         
-        for metadata_file in metadata_files:
-            print(f"\n📄 Processing: {metadata_file.name}")
-            
-            # Load metadata
-            with open(metadata_file, 'r') as f:
-                scene_metadata = json.load(f)
-            
-            # Download and extract
-            safe_path = downloader.download_scene_with_progress(scene_metadata)
-            
-            if safe_path:
-                print(f"✅ Complete: {safe_path.name}")
-            else:
-                print(f"❌ Failed: {metadata_file.name}")
+        # Network I/O releases the GIL, so threads overlap scene downloads;
+        # ASFSession is a requests.Session and safe to share for these reads
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+            try:
+                futures = {}
+                for metadata_file in metadata_files:
+                    print(f"\n📄 Processing: {metadata_file.name}")
+                    scene_metadata = _loads(metadata_file.read_bytes())
+                    futures[executor.submit(downloader.download_scene_with_progress, scene_metadata)] = metadata_file
+                
+                for future in as_completed(futures):
+                    metadata_file = futures[future]
+                    safe_path = future.result()
+                    
+                    if safe_path:
+                        print(f"✅ Complete: {safe_path.name}")
+                    else:
+                        print(f"❌ Failed: {metadata_file.name}")
+            except BaseException:
+                # Drop queued scenes; only downloads already running finish
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
             
     except KeyboardInterrupt:
         print("⏹️  Download interrupted by user")
@@ -3,6 +3,13 @@ import json
 import os
 from pathlib import Path
 
+# orjson is a faster drop-in for parsing; fall back to the stdlib parser
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 # ============================================================================
 # CONFIGURATION - EDIT THESE VALUES
 # ============================================================================
@@ -66,6 +73,8 @@ MAX_CLOUD_COVER = 20   # Maximum cloud cover percentage
 
 # 5. ASF SETTINGS
 ASF_MAX_RESULTS = 100  # Maximum search results from ASF
+ASF_DOWNLOAD_PRODUCTS = False  # Stream full products in the pipeline (needs EDL_TOKEN); otherwise use downloader.py
+ASF_CATALOG_CACHE = False  # Opt-in: cache search results per day (<data_directory>/asf_catalog.sqlite) so scheduled runs only query new days
 
 # 6. PROCESSING SETTINGS
 PROCESSING_RESOLUTION = 10  # Resolution in meters
@@ -118,7 +127,9 @@ def create_configuration():
         },
         "asf": {
             "download_directory": ASF_DOWNLOAD_DIRECTORY,
-            "max_results": ASF_MAX_RESULTS
+            "max_results": ASF_MAX_RESULTS,
+            "download_products": ASF_DOWNLOAD_PRODUCTS,
+            "catalog_cache": ASF_CATALOG_CACHE
         },
         "processing": {
             "resolution": PROCESSING_RESOLUTION,
@@ -174,8 +185,7 @@ SH_INSTANCE_ID={SENTINEL_HUB_INSTANCE_ID}
 def validate_config(config_file="pipeline_config.json"):
     """Validate pipeline configuration"""
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
+        config = _loads(Path(config_file).read_bytes())
     except FileNotFoundError:
         print(f"❌ Config file {config_file} not found")
         return False
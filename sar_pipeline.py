@@ -6,19 +6,26 @@ Optimized for OSINT change detection workflows
 """
 
 import os
+import sys
 import json
+import queue
+import sqlite3
+import hashlib
 import logging
 import asyncio
+import threading
+from collections import deque
 import aiofiles
-from datetime import datetime, timedelta
+import httpx
+import numpy as np
+from datetime import date, datetime, timedelta
 from pathlib import Path
-import requests
 from typing import List, Dict, Tuple, Optional
 import geopandas as gpd
 from shapely.geometry import Polygon
 import asf_search as asf
 from sentinelhub import (
-    SHConfig, DataCollection, BBox, CRS, MimeType, 
+    SHConfig, DataCollection, MimeType, 
     SentinelHubRequest, bbox_to_dimensions
 )
 
@@ -33,6 +40,360 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional: orjson encodes straight to bytes and handles datetimes natively
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj, pretty: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None,
+                          default=lambda o: o.isoformat()).encode()
+
+# Upper bound on simultaneous ASF/Sentinel Hub downloads per pipeline run
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Hosts (and their subdomains) that receive the EDL bearer token
+EARTHDATA_AUTH_HOSTS = ('asf.alaska.edu', 'earthdata.nasa.gov')
+
+# Received bytes a streamed download may have queued for disk before it waits
+MAX_INFLIGHT_WRITE_BYTES = 32 << 20
+
+# Bytes between progress log lines when streaming ASF products
+PROGRESS_LOG_INTERVAL = 256 << 20
+
+# Seconds before a scheduled run at which its ASF search is started
+PREFETCH_LEAD_TIME = 600
+
+# Sentinel-1 VV/VH evalscript; kept byte-identical across requests so CDSE can cache it
+EVALSCRIPT_VV_VH = """
+//VERSION=3
+function setup() {
+    return {
+        input: ["VV", "VH"],
+        output: {
+            id: "default",
+            bands: 2,
+            sampleType: "FLOAT32"
+        }
+    };
+}
+
+function evaluatePixel(sample) {
+    return [sample.VV, sample.VH];
+}
+"""
+_SH_EVALSCRIPT_HASH = hashlib.blake2b(EVALSCRIPT_VV_VH.encode(), digest_size=8).hexdigest()
+
+# Days of ASF search results kept in the catalog cache (at least the configured days_back)
+CATALOG_RETENTION_DAYS = 90
+
+# First retry delay in seconds after a failed scheduled run; doubles per failure
+SCHEDULE_RETRY_DELAY = 300
+
+# ASF property names to try, in order, for the granule name and acquisition time
+_GRANULE_KEYS = ('sceneName', 'fileName', 'granuleName', 'productName')
+_DATE_KEYS = ('startTime', 'acquisitionDate', 'sensingTime')
+
+async def _attach_earthdata_token(request: httpx.Request):
+    """
+    Request hook adding the EDL bearer token for ASF and Earthdata Login hosts
+
+    httpx drops Authorization on cross-origin redirects, and product URLs
+    redirect datapool -> sentinel1.asf -> URS before landing on S3. Hooks run
+    for every hop, so the token reaches URS but never the S3 target.
+    """
+    token = os.getenv('EDL_TOKEN')
+    host = request.url.host
+    if token and request.url.scheme == 'https' and any(
+            host == suffix or host.endswith('.' + suffix) for suffix in EARTHDATA_AUTH_HOSTS):
+        request.headers['Authorization'] = f"Bearer {token}"
+
+
+class BatchWriteEngine:
+    """
+    Single writer thread that coalesces queued file writes into pwritev() calls
+
+    aiofiles hands every write to a thread pool worker; here all writes go to
+    one thread, and contiguous writes to the same file are submitted as a
+    single vectored syscall. Completion is reported back to the awaiting
+    coroutine's event loop.
+    """
+
+    MAX_BATCH = 64
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='sar-writer', daemon=True)
+        self._thread.start()
+
+    def submit(self, fd: int, offset: int, data) -> asyncio.Future:
+        """Queue a positional write; the returned future resolves once it is on disk"""
+        if not self._thread.is_alive():
+            raise RuntimeError("write engine thread has stopped")
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.put((fd, offset, data, loop, future))
+        return future
+
+    def close(self, fd: int):
+        """Close fd on the writer thread, after every write already queued for it"""
+        self._queue.put((fd, None, None, None, None))
+
+    def _run(self):
+        while True:
+            ops = [self._queue.get()]
+            while len(ops) < self.MAX_BATCH:
+                try:
+                    ops.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            i = 0
+            while i < len(ops):
+                if ops[i][2] is None:
+                    try:
+                        os.close(ops[i][0])
+                    except OSError:
+                        pass
+                    i += 1
+                    continue
+                
+                # Extend the batch while the next op continues the same file
+                fd, offset, data = ops[i][:3]
+                end = offset + len(data)
+                j = i + 1
+                while j < len(ops) and ops[j][0] == fd and ops[j][2] is not None and ops[j][1] == end:
+                    end += len(ops[j][2])
+                    j += 1
+
+                error = None
+                try:
+                    self._pwritev_all(fd, offset, [op[2] for op in ops[i:j]])
+                except Exception as e:
+                    error = e
+                for op in ops[i:j]:
+                    try:
+                        op[3].call_soon_threadsafe(_resolve_write, op[4], error)
+                    except RuntimeError:
+                        # The submitting loop has closed; nobody is waiting
+                        pass
+                i = j
+
+    def is_alive(self) -> bool:
+        return self._thread.is_alive()
+
+    @staticmethod
+    def _pwritev_all(fd: int, offset: int, buffers: list):
+        pending = deque(memoryview(b).cast('B') for b in buffers)
+        while pending:
+            written = os.pwritev(fd, pending, offset)
+            offset += written
+            while pending and written >= len(pending[0]):
+                written -= len(pending.popleft())
+            if written:
+                pending[0] = pending[0][written:]
+
+
+def _resolve_write(future: asyncio.Future, error: Optional[Exception]):
+    if future.cancelled():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+_write_engine: Optional[BatchWriteEngine] = None
+
+
+def _get_write_engine() -> Optional[BatchWriteEngine]:
+    """Shared write engine on Linux, None elsewhere (callers fall back to aiofiles)"""
+    global _write_engine
+    if sys.platform != 'linux' or not hasattr(os, 'pwritev'):
+        return None
+    if _write_engine is None or not _write_engine.is_alive():
+        _write_engine = BatchWriteEngine()
+    return _write_engine
+
+
+class AsyncFileWriter:
+    """
+    Async context manager writing a file sequentially through the write engine
+
+    write() hands each received chunk to the engine and returns without
+    waiting for the disk, so the caller can keep receiving; it only blocks
+    once MAX_INFLIGHT_WRITE_BYTES are queued. Pending writes are awaited on
+    exit. If the block fails or is cancelled, the partial file is deleted.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._engine = None
+        self._fd = None
+        self._aio = None
+        self._offset = 0
+        self._inflight = 0
+        self._pending = set()
+        self._error = None
+
+    async def __aenter__(self):
+        self._engine = _get_write_engine()
+        if self._engine is None:
+            self._aio = await aiofiles.open(self.path, 'wb')
+        else:
+            self._fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o644)
+        return self
+
+    async def write(self, data: bytes):
+        if self._aio is not None:
+            await self._aio.write(data)
+            return
+        if self._error is not None:
+            raise self._error
+        future = self._engine.submit(self._fd, self._offset, data)
+        self._offset += len(data)
+        self._inflight += len(data)
+        self._pending.add(future)
+        future.add_done_callback(lambda f: self._write_done(f, len(data)))
+        # Backpressure: bound the received-but-unwritten bytes held in memory
+        while self._inflight > MAX_INFLIGHT_WRITE_BYTES:
+            await asyncio.wait(set(self._pending), return_when=asyncio.FIRST_COMPLETED)
+
+    def _write_done(self, future: asyncio.Future, size: int):
+        self._pending.discard(future)
+        self._inflight -= size
+        if not future.cancelled() and future.exception() is not None and self._error is None:
+            self._error = future.exception()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        failed = exc_type is not None
+        if self._aio is not None:
+            await self._aio.close()
+            if failed:
+                self.path.unlink(missing_ok=True)
+            return
+        try:
+            if not failed:
+                if self._pending:
+                    await asyncio.wait(set(self._pending))
+                failed = self._error is not None
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            # Writes may still be queued (e.g. when cancelled above); the engine
+            # closes the fd only after them, so the number can't be reused early
+            self._engine.close(self._fd)
+            if failed:
+                self.path.unlink(missing_ok=True)
+        if self._error is not None and exc_type is None:
+            raise self._error
+
+
+async def _awrite_small(path: Path, data: bytes):
+    """Write a small file (JSON sidecars, summaries) in one worker-thread call"""
+    await asyncio.to_thread(path.write_bytes, data)
+
+
+def _acquired_within(item: Dict, start_date: datetime, end_date: datetime) -> bool:
+    """Whether a cached result's acquisition time falls in [start_date, end_date]"""
+    # ASF reports UTC ('...Z'); search bounds are naive, as passed to asf.search
+    acquired = item['acquisition_date'].replace('Z', '').replace('+00:00', '')
+    try:
+        return start_date <= datetime.fromisoformat(acquired) <= end_date
+    except ValueError:
+        return False
+
+
+class GranuleCache:
+    """
+    SQLite cache of parsed ASF search results, keyed by query and acquisition day
+
+    Days that have been fully searched are recorded so scheduled runs only
+    query ASF for days they haven't seen. The most recent SETTLE_DAYS stay
+    open because ASF is still ingesting granules for them.
+    """
+
+    SETTLE_DAYS = 2
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript("""
+                CREATE TABLE IF NOT EXISTS granules (
+                    bbox_hash TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    granule_name TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (bbox_hash, granule_name)
+                );
+                CREATE INDEX IF NOT EXISTS granules_by_day ON granules (bbox_hash, day);
+                CREATE TABLE IF NOT EXISTS fetched_days (
+                    bbox_hash TEXT NOT NULL,
+                    day INTEGER NOT NULL,
+                    PRIMARY KEY (bbox_hash, day)
+                );
+            """)
+            self._conn = conn
+        return self._conn
+
+    def fetched_days(self, key: str, first_day: int, last_day: int) -> set:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT day FROM fetched_days WHERE bbox_hash = ? AND day BETWEEN ? AND ?",
+                (key, first_day, last_day)
+            ).fetchall()
+        return {day for (day,) in rows}
+
+    def store(self, key: str, data_list: List[Dict], settled_days: List[int], oldest_day: int):
+        """Insert results and settled days, pruning entries acquired before oldest_day"""
+        rows = []
+        for item in data_list:
+            if 'error' in item:
+                continue
+            try:
+                day = date.fromisoformat(item['acquisition_date'][:10]).toordinal()
+            except ValueError:
+                continue
+            rows.append((key, day, item['granule_name'], _dumps(item)))
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO granules VALUES (?, ?, ?, ?)", rows)
+                conn.executemany("INSERT OR IGNORE INTO fetched_days VALUES (?, ?)",
+                                 [(key, day) for day in settled_days])
+                # Windows of different lengths share the cache, so callers pass a
+                # fixed retention horizon rather than the current window start
+                conn.execute("DELETE FROM granules WHERE bbox_hash = ? AND day < ?", (key, oldest_day))
+                conn.execute("DELETE FROM fetched_days WHERE bbox_hash = ? AND day < ?", (key, oldest_day))
+
+    def load(self, key: str, first_day: int, last_day: int) -> List[Dict]:
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT payload FROM granules WHERE bbox_hash = ? AND day BETWEEN ? AND ? ORDER BY day",
+                (key, first_day, last_day)
+            ).fetchall()
+        return [_loads(payload) for (payload,) in rows]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
 class SARDataPipeline:
     """
     Automated SAR data retrieval pipeline supporting ASF and Copernicus sources
@@ -44,8 +405,16 @@ class SARDataPipeline:
         self.data_dir = Path(self.config['data_directory'])
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize ASF configuration
-        self.asf_session = self._setup_asf()
+        # Pooled HTTP/2 client, created lazily on the running event loop
+        self._http: Optional[httpx.AsyncClient] = None
+        
+        # (days_back, start, end, task) for an ASF search started ahead of a scheduled run
+        self._prefetch: Optional[Tuple[int, datetime, datetime, asyncio.Task]] = None
+        
+        # Per-day cache of ASF search results for scheduled runs
+        self._granule_cache = None
+        if self.config['asf'].get('catalog_cache', False):
+            self._granule_cache = GranuleCache(self.data_dir / 'asf_catalog.sqlite')
         
         # Initialize Sentinel Hub configuration
         self.sh_config = self._setup_sentinel_hub()
@@ -55,9 +424,7 @@ class SARDataPipeline:
     def load_config(self, config_file: str) -> dict:
         """Load pipeline configuration from JSON file"""
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
-            return config
+            return _loads(Path(config_file).read_bytes())
         except FileNotFoundError:
             logger.warning(f"Config file {config_file} not found. Creating default config.")
             return self._create_default_config(config_file)
@@ -88,7 +455,9 @@ class SARDataPipeline:
             },
             "asf": {
                 "download_directory": "./sar_data/asf",
-                "max_results": 100
+                "max_results": 100,
+                "download_products": False,
+                "catalog_cache": False
             },
             "processing": {
                 "resolution": 10,
@@ -96,20 +465,32 @@ class SARDataPipeline:
             }
         }
         
-        with open(config_file, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        Path(config_file).write_bytes(_dumps(default_config, pretty=True))
         
         logger.info(f"Created default config file: {config_file}")
         logger.info("Please update the configuration with your credentials and area of interest")
         return default_config
 
-    def _setup_asf(self) -> requests.Session:
-        """Setup ASF session for data retrieval"""
-        session = requests.Session()
-        session.headers.update({
-            'User-Agent': 'SAR-Pipeline/1.0'
-        })
-        return session
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Shared HTTP/2 client for ASF/CDSE requests; requests to one host multiplex over one connection"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                timeout=httpx.Timeout(60.0, connect=10.0),
+                follow_redirects=True,
+                headers={'User-Agent': 'SAR-Pipeline/1.0'},
+                event_hooks={'request': [_attach_earthdata_token]}
+            )
+        return self._http
+
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        if self._granule_cache is not None:
+            await asyncio.to_thread(self._granule_cache.close)
 
     def _setup_sentinel_hub(self) -> SHConfig:
         """Setup Sentinel Hub configuration for Copernicus Data Space Ecosystem"""
@@ -134,78 +515,141 @@ class SARDataPipeline:
             
         return config
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Replacing the config invalidates the cached AOI geometry
+        if name == 'config':
+            self._cache_aoi()
+
+    def _cache_aoi(self):
+        """Build the area of interest geometry once per config"""
+        self._aoi_polygon = Polygon(self.config['area_of_interest']['coordinates'])
+        self._aoi_wkt = self._aoi_polygon.wkt
+        self._aoi_bounds = tuple(self._aoi_polygon.bounds)
+
     def get_area_bbox(self) -> Tuple[float, float, float, float]:
         """Convert area of interest to bounding box"""
-        coords = self.config['area_of_interest']['coordinates']
-        polygon = Polygon(coords)
-        return polygon.bounds  # (minx, miny, maxx, maxy)
+        return self._aoi_bounds  # (minx, miny, maxx, maxy)
+
+    def _parse_asf_results(self, results) -> List[Dict]:
+        """Flatten asf_search products into plain metadata dicts"""
+        # Convert to list of dictionaries for easier handling
+        data_list = []
+        for result in results:
+            props = result.properties
+            try:
+                # Handle different property names that might exist
+                granule_name = next((props[k] for k in _GRANULE_KEYS if props.get(k)), 'unknown_granule')
+                acquisition_date = next((props[k] for k in _DATE_KEYS if props.get(k)), 'unknown_date')
+                size_bytes = props.get('bytes')
+                
+                data_list.append({
+                    'granule_name': granule_name,
+                    'acquisition_date': str(acquisition_date),
+                    'platform': props.get('platform', 'SENTINEL-1'),
+                    'beam_mode': props.get('beamModeType', 'unknown'),
+                    'url': props.get('url', ''),
+                    'size_mb': size_bytes / (1024*1024) if size_bytes else 0,
+                    'path': props.get('pathNumber', 'unknown'),
+                    'frame': props.get('frameNumber', 'unknown'),
+                    'orbit_direction': props.get('flightDirection', 'unknown'),
+                    'polarization': props.get('polarization', 'unknown'),
+                    's3_urls': props.get('s3Urls', [])  # For cloud access
+                })
+            except Exception as prop_error:
+                logger.warning(f"Error parsing result properties: {prop_error}")
+                logger.warning(f"Available properties: {list(props.keys())}")
+                # Still add a basic entry
+                data_list.append({
+                    'granule_name': 'parsing_error',
+                    'acquisition_date': 'unknown',
+                    'platform': 'SENTINEL-1',
+                    'error': str(prop_error),
+                    'all_properties': list(props.keys())
+                })
+
+        return data_list
+
+    def _catalog_key(self) -> str:
+        """Catalog cache key for the current AOI and product selection"""
+        query = f"{self._aoi_wkt}|{asf.PLATFORM.SENTINEL1}|{asf.PRODUCT_TYPE.SLC}"
+        return hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
 
     async def search_asf_data(self, start_date: datetime, end_date: datetime) -> List[Dict]:
-        """Search for Sentinel-1 data using ASF API"""
+        """Search for Sentinel-1 data using ASF API, reusing cached days where possible"""
         logger.info(f"Searching ASF for data from {start_date} to {end_date}")
         
         try:
-            # Create WKT from area of interest
-            coords = self.config['area_of_interest']['coordinates']
-            polygon = Polygon(coords)
-            wkt = polygon.wkt
-            
-            # Search for Sentinel-1 SLC products
-            results = asf.search(
-                platform=[asf.PLATFORM.SENTINEL1],
-                processingLevel=[asf.PRODUCT_TYPE.SLC],
-                start=start_date,
-                end=end_date,
-                intersectsWith=wkt,
-                maxResults=self.config['asf']['max_results']
-            )
-            
-            logger.info(f"Found {len(results)} ASF results")
+            cache = self._granule_cache
+            key = self._catalog_key()
+            first_day, last_day = start_date.toordinal(), end_date.toordinal()
+            cached_days = set()
+            cached = []
+            if cache is not None:
+                # The cache is best-effort: on any SQLite error (locked by another
+                # process, corrupt file) fall back to a full, uncached search
+                try:
+                    cached_days = await asyncio.to_thread(cache.fetched_days, key, first_day, last_day)
+                    if cached_days:
+                        cached = await asyncio.to_thread(cache.load, key, first_day, last_day)
+                except sqlite3.Error as e:
+                    logger.warning(f"ASF catalog cache unavailable, searching without it: {e}")
+                    cache, cached_days, cached = None, set(), []
+            missing = [day for day in range(first_day, last_day + 1) if day not in cached_days]
             
-            # Convert to list of dictionaries for easier handling
             data_list = []
-            for result in results:
-                try:
-                    # Handle different property names that might exist
-                    granule_name = (
-                        result.properties.get('sceneName') or
-                        result.properties.get('fileName') or
-                        result.properties.get('granuleName') or
-                        result.properties.get('productName') or
-                        'unknown_granule'
-                    )
-                    
-                    acquisition_date = (
-                        result.properties.get('startTime') or
-                        result.properties.get('acquisitionDate') or
-                        result.properties.get('sensingTime') or
-                        'unknown_date'
-                    )
-                    
-                    data_list.append({
-                        'granule_name': granule_name,
-                        'acquisition_date': str(acquisition_date),
-                        'platform': result.properties.get('platform', 'SENTINEL-1'),
-                        'beam_mode': result.properties.get('beamModeType', 'unknown'),
-                        'url': result.properties.get('url', ''),
-                        'size_mb': result.properties.get('bytes', 0) / (1024*1024) if result.properties.get('bytes') else 0,
-                        'path': result.properties.get('pathNumber', 'unknown'),
-                        'frame': result.properties.get('frameNumber', 'unknown'),
-                        'orbit_direction': result.properties.get('flightDirection', 'unknown'),
-                        'polarization': result.properties.get('polarization', 'unknown'),
-                        's3_urls': result.properties.get('s3Urls', [])  # For cloud access
-                    })
-                except Exception as prop_error:
-                    logger.warning(f"Error parsing result properties: {prop_error}")
-                    logger.warning(f"Available properties: {list(result.properties.keys())}")
-                    # Still add a basic entry
-                    data_list.append({
-                        'granule_name': 'parsing_error',
-                        'acquisition_date': 'unknown',
-                        'platform': 'SENTINEL-1',
-                        'error': str(prop_error),
-                        'all_properties': list(result.properties.keys())
-                    })
+            if missing:
+                # Only query the span of days the cache can't answer
+                fetch_start = max(start_date, datetime.fromordinal(missing[0]))
+                fetch_end = min(end_date, datetime.fromordinal(missing[-1] + 1))
+                max_results = self.config['asf']['max_results']
+                
+                # Search for Sentinel-1 SLC products
+                # asf.search performs blocking HTTP; keep it off the event loop
+                results = await asyncio.to_thread(
+                    asf.search,
+                    platform=[asf.PLATFORM.SENTINEL1],
+                    processingLevel=[asf.PRODUCT_TYPE.SLC],
+                    start=fetch_start,
+                    end=fetch_end,
+                    intersectsWith=self._aoi_wkt,
+                    maxResults=max_results
+                )
+                
+                logger.info(f"Found {len(results)} ASF results")
+                
+                truncated = len(results) >= max_results
+                data_list = self._parse_asf_results(results)
+                
+                if cache is not None:
+                    # A day is settled once it is fully inside the fetched window,
+                    # old enough that ASF has finished ingesting it, and the
+                    # search wasn't cut off at max_results
+                    settle_before = date.today().toordinal() - GranuleCache.SETTLE_DAYS
+                    settled = [] if truncated else [
+                        day for day in missing
+                        if day < settle_before
+                        and datetime.fromordinal(day) >= fetch_start
+                        and datetime.fromordinal(day + 1) <= fetch_end
+                    ]
+                    try:
+                        retention = max(CATALOG_RETENTION_DAYS, self.config['temporal_range']['days_back'])
+                        oldest_day = date.today().toordinal() - retention
+                        await asyncio.to_thread(cache.store, key, data_list, settled, oldest_day)
+                    except sqlite3.Error as e:
+                        logger.warning(f"Could not update the ASF catalog cache: {e}")
+            else:
+                logger.info("All requested days are in the catalog cache")
+            
+            if cached_days:
+                # Cached rows cover whole days; keep only those inside the exact window
+                seen = {item['granule_name'] for item in data_list}
+                data_list.extend(
+                    item for item in cached
+                    if item['granule_name'] not in seen
+                    and _acquired_within(item, start_date, end_date)
+                )
+                logger.info(f"{len(data_list)} ASF results after merging the catalog cache")
             
             return data_list
             
@@ -219,51 +663,58 @@ class SARDataPipeline:
             logger.warning("No ASF results to filter")
             return []
         
-        # Parse dates and sort
-        scenes_with_dates = []
-        current_time = datetime.now()
-        
-        for scene in asf_results:
-            try:
-                acq_date_str = scene.get('acquisition_date', '')
-                if 'T' in acq_date_str:
-                    # Handle ISO format with potential timezone
-                    acq_date_str = acq_date_str.replace('Z', '+00:00')
-                    if '+00:00' in acq_date_str:
-                        acq_date = datetime.fromisoformat(acq_date_str.replace('+00:00', ''))
-                    else:
-                        acq_date = datetime.fromisoformat(acq_date_str)
-                    scenes_with_dates.append((scene, acq_date))
-                else:
-                    logger.warning(f"Could not parse date: {acq_date_str}")
-            except Exception as e:
-                logger.warning(f"Error parsing date for scene {scene.get('granule_name', 'unknown')}: {e}")
-        
-        if not scenes_with_dates:
+        # Parse all acquisition dates in one vectorized pass; index maps
+        # each parsed date back to its scene in asf_results
+        raw = np.asarray([scene.get('acquisition_date', '') for scene in asf_results], dtype=str)
+        mask = np.char.find(raw, 'T') >= 0
+        index = np.flatnonzero(mask)
+        # np.char.replace can't size an empty result
+        stripped = np.char.rstrip(np.char.replace(raw[mask], '+00:00', ''), 'Z') if index.size else raw[mask]
+        try:
+            dates = stripped.astype('datetime64[us]')
+        except ValueError:
+            # Slow path: parse one by one and drop the unparseable rows
+            parsed = []
+            for i, date_str in zip(index, stripped):
+                try:
+                    parsed.append((i, np.datetime64(date_str, 'us')))
+                except ValueError:
+                    parsed.append((i, np.datetime64('NaT')))
+            dates = np.array([date for _, date in parsed], dtype='datetime64[us]')
+        
+        valid = ~np.isnat(dates)
+        for i in np.flatnonzero(~mask).tolist() + index[~valid].tolist():
+            scene = asf_results[i]
+            logger.warning(f"Could not parse date for scene {scene.get('granule_name', 'unknown')}: {scene.get('acquisition_date', '')!r}")
+        index = index[valid]
+        dates = dates[valid]
+        scenes = [asf_results[i] for i in index]
+        
+        if not scenes:
             logger.error("No scenes with valid dates found")
             return []
         
-        # Sort by date (newest first)
-        scenes_with_dates.sort(key=lambda x: x[1], reverse=True)
-        
         # Find most recent scene
-        most_recent = scenes_with_dates[0]
-        logger.info(f"Most recent scene: {most_recent[0]['granule_name']} ({most_recent[1].date()})")
+        most_recent_idx = int(dates.argmax())
+        most_recent = scenes[most_recent_idx]
+        logger.info(f"Most recent scene: {most_recent['granule_name']} ({dates[most_recent_idx].astype('datetime64[D]')})")
         
         # Find scene closest to target days back
-        target_date = current_time - timedelta(days=days_back)
+        target_date = datetime.now() - timedelta(days=days_back)
         logger.info(f"Target date ({days_back} days back): {target_date.date()}")
         
         # Find closest match to target date
-        closest_scene = min(scenes_with_dates, key=lambda x: abs((x[1] - target_date).days))
-        days_difference = abs((closest_scene[1] - target_date).days)
+        offsets = np.abs(dates - np.datetime64(target_date, 'us'))
+        closest_idx = int(offsets.argmin())
+        closest_scene = scenes[closest_idx]
+        days_difference = int(offsets[closest_idx] // np.timedelta64(1, 'D'))
         
-        logger.info(f"Closest scene to target: {closest_scene[0]['granule_name']} ({closest_scene[1].date()}) - {days_difference} days from target")
+        logger.info(f"Closest scene to target: {closest_scene['granule_name']} ({dates[closest_idx].astype('datetime64[D]')}) - {days_difference} days from target")
         
         # Return both scenes (avoid duplicates)
-        selected_scenes = [most_recent[0]]
-        if closest_scene[0]['granule_name'] != most_recent[0]['granule_name']:
-            selected_scenes.append(closest_scene[0])
+        selected_scenes = [most_recent]
+        if closest_scene['granule_name'] != most_recent['granule_name']:
+            selected_scenes.append(closest_scene)
         else:
             logger.info("Most recent scene is also the closest to target date")
         
@@ -281,40 +732,18 @@ class SARDataPipeline:
                 
             # Define area of interest
             bbox_coords = self.get_area_bbox()
-            bbox = BBox(bbox=bbox_coords, crs=CRS.WGS84)
             
             # For CDSE, we can use the Catalog API to search for data
             # This is more modern than the old Instance-based approach
             
-            # Create a simple evalscript for Sentinel-1 data
-            evalscript = """
-            //VERSION=3
-            function setup() {
-                return {
-                    input: ["VV", "VH"],
-                    output: { 
-                        id: "default",
-                        bands: 2,
-                        sampleType: "FLOAT32"
-                    }
-                };
-            }
-            
-            function evaluatePixel(sample) {
-                return [sample.VV, sample.VH];
-            }
-            """
-            
-            # Search using the modern CDSE approach
-            time_interval = (start_date.isoformat(), end_date.isoformat())
-            
             # Return metadata for available data
             return [{
                 'source': 'sentinel_hub_cdse',
                 'bbox': bbox_coords,
                 'time_range': f"{start_date.isoformat()}/{end_date.isoformat()}",
                 'collection': 'SENTINEL1_IW',
-                'evalscript': evalscript,
+                'evalscript': EVALSCRIPT_VV_VH,
+                'evalscript_hash': _SH_EVALSCRIPT_HASH,
                 'search_ready': True,
                 'note': 'Using Copernicus Data Space Ecosystem'
             }]
@@ -335,14 +764,38 @@ class SARDataPipeline:
             
             logger.info(f"Downloading {granule_name} ({data_item['size_mb']} MB)")
             
-            # Use ASF download (requires authentication for full products)
-            # For now, we'll simulate the download process
-            url = data_item['url']
-            
-            async with aiofiles.open(download_path.with_suffix('.json'), 'w') as f:
-                await f.write(json.dumps(data_item, indent=2))
+            await _awrite_small(download_path.with_suffix('.json'), _dumps(data_item, pretty=True))
             
             logger.info(f"Metadata saved for {granule_name}")
+            
+            # Full products need Earthdata auth; by default only metadata is saved
+            # and downloader.py fetches the product
+            if self.config['asf'].get('download_products') and data_item.get('url'):
+                client = await self._get_http_client()
+                
+                # Multi-GB products need a longer read timeout than catalog calls
+                timeout = httpx.Timeout(60.0, connect=10.0, read=300.0)
+                # Stream to a .part file so an interrupted download never
+                # leaves a truncated .zip that the exists() check would accept
+                part_path = download_path.with_suffix('.zip.part')
+                async with client.stream('GET', data_item['url'], timeout=timeout) as resp:
+                    resp.raise_for_status()
+                    total = int(resp.headers.get('Content-Length', 0))
+                    next_report = PROGRESS_LOG_INTERVAL
+                    async with AsyncFileWriter(part_path) as f:
+                        async for chunk in resp.aiter_bytes(1 << 20):
+                            await f.write(chunk)
+                            received = resp.num_bytes_downloaded
+                            if received >= next_report:
+                                if total:
+                                    logger.info(f"{granule_name}: {received / total:.0%} of {total / 1e6:.0f} MB")
+                                else:
+                                    logger.info(f"{granule_name}: {received / 1e6:.0f} MB")
+                                next_report += PROGRESS_LOG_INTERVAL
+                os.replace(part_path, download_path)
+                
+                logger.info(f"Product saved for {granule_name}")
+            
             return True
             
         except Exception as e:
@@ -366,8 +819,7 @@ class SARDataPipeline:
             logger.info(f"Processing Sentinel Hub request for {data_item['time_range']}")
             
             # Save metadata for now
-            async with aiofiles.open(download_path.with_suffix('.json'), 'w') as f:
-                await f.write(json.dumps(data_item, indent=2))
+            await _awrite_small(download_path.with_suffix('.json'), _dumps(data_item, pretty=True))
             
             return True
             
@@ -379,92 +831,155 @@ class SARDataPipeline:
         """Run the complete data retrieval pipeline"""
         logger.info("Starting SAR data pipeline execution")
         
-        # Calculate time range
-        if days_back is None:
-            days_back = self.config['temporal_range']['days_back']
+        try:
+            # Calculate time range
+            if days_back is None:
+                days_back = self.config['temporal_range']['days_back']
             
-        end_date = datetime.now()
+            end_date = datetime.now()
+            start_date = end_date - timedelta(days=days_back)
+            
+            # Use the scheduler's prefetched ASF search if it covers this run
+            asf_search = None
+            prefetch, self._prefetch = self._prefetch, None
+            if prefetch is not None:
+                prefetch_days_back, prefetch_start, prefetch_end, task = prefetch
+                if (prefetch_days_back == days_back and
+                        abs((prefetch_end - end_date).total_seconds()) <= PREFETCH_LEAD_TIME):
+                    logger.info("Using prefetched ASF search results")
+                    start_date, end_date = prefetch_start, prefetch_end
+                    asf_search = task
+                else:
+                    task.cancel()
+            if asf_search is None:
+                asf_search = self.search_asf_data(start_date, end_date)
+            
+            logger.info(f"Searching for data from {start_date} to {end_date}")
+            
+            # Create download directories
+            asf_dir = self.data_dir / "asf"
+            sh_dir = self.data_dir / "sentinel_hub"
+            asf_dir.mkdir(exist_ok=True)
+            sh_dir.mkdir(exist_ok=True)
+            
+            # Search both sources concurrently - they hit independent services
+            asf_results, sh_results = await asyncio.gather(
+                asf_search,
+                self.search_sentinel_hub_data(start_date, end_date),
+                return_exceptions=True
+            )
+            if isinstance(asf_results, BaseException):
+                logger.error(f"ASF search failed: {asf_results}")
+                asf_results = []
+            if isinstance(sh_results, BaseException):
+                logger.error(f"Sentinel Hub search failed: {sh_results}")
+                sh_results = []
+            
+            # Find target scenes (most recent + closest to days_back)
+            target_scenes = self.find_target_scenes(asf_results, days_back)
+            
+            # Download selected ASF scenes and Sentinel Hub data concurrently
+            logger.info(f"\n{'='*60}")
+            logger.info(f"DOWNLOADING SELECTED SCENES")
+            logger.info(f"{'='*60}")
+            
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+            
+            async def bounded(coro):
+                async with semaphore:
+                    return await coro
+            
+            tasks = [bounded(self.download_asf_data(item, asf_dir)) for item in target_scenes]
+            tasks += [bounded(self.download_sentinel_hub_data(item, sh_dir)) for item in sh_results]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            # Failed downloads count as unsuccessful
+            results = [r is True for r in results]
+            asf_downloads = results[:len(target_scenes)]
+            sh_downloads = results[len(target_scenes):]
+            
+            # Generate summary
+            summary = {
+                'execution_time': datetime.now().isoformat(),
+                'time_range': {
+                    'start': start_date.isoformat(),
+                    'end': end_date.isoformat()
+                },
+                'target_days_back': days_back,
+                'asf_results': {
+                    'found': len(asf_results),
+                    'selected': len(target_scenes),
+                    'downloaded': sum(asf_downloads)
+                },
+                'sentinel_hub_results': {
+                    'found': len(sh_results),
+                    'processed': sum(sh_downloads)
+                },
+                'total_files': sum(asf_downloads) + sum(sh_downloads),
+                'selected_scenes': [scene['granule_name'] for scene in target_scenes]
+            }
+            
+            # Save summary
+            summary_path = self.data_dir / f"pipeline_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            await _awrite_small(summary_path, _dumps(summary, pretty=True))
+            
+            logger.info(f"\n{'='*60}")
+            logger.info(f"PIPELINE EXECUTION COMPLETED")
+            logger.info(f"Selected scenes: {[scene['granule_name'] for scene in target_scenes]}")
+            logger.info(f"Summary: {summary}")
+            logger.info(f"{'='*60}")
+            return summary
+        finally:
+            await self.aclose()
+
+    def _start_prefetch(self, seconds_ahead: float):
+        """Begin the ASF search for a run due in seconds_ahead"""
+        days_back = self.config['temporal_range']['days_back']
+        end_date = datetime.now() + timedelta(seconds=seconds_ahead)
         start_date = end_date - timedelta(days=days_back)
-        
-        logger.info(f"Searching for data from {start_date} to {end_date}")
-        
-        # Create download directories
-        asf_dir = self.data_dir / "asf"
-        sh_dir = self.data_dir / "sentinel_hub"
-        asf_dir.mkdir(exist_ok=True)
-        sh_dir.mkdir(exist_ok=True)
-        
-        # Search both sources
-        asf_results = await self.search_asf_data(start_date, end_date)
-        sh_results = await self.search_sentinel_hub_data(start_date, end_date)
-        
-        # Find target scenes (most recent + closest to days_back)
-        target_scenes = self.find_target_scenes(asf_results, days_back)
-        
-        # Download data
-        asf_downloads = []
-        sh_downloads = []
-        
-        # Download selected ASF scenes
-        logger.info(f"\n{'='*60}")
-        logger.info(f"DOWNLOADING SELECTED SCENES")
-        logger.info(f"{'='*60}")
-        
-        for i, item in enumerate(target_scenes, 1):
-            logger.info(f"\nDownloading scene {i}/{len(target_scenes)}: {item['granule_name']}")
-            success = await self.download_asf_data(item, asf_dir)
-            asf_downloads.append(success)
-        
-        # Download Sentinel Hub data
-        for item in sh_results:
-            success = await self.download_sentinel_hub_data(item, sh_dir)
-            sh_downloads.append(success)
-        
-        # Generate summary
-        summary = {
-            'execution_time': datetime.now().isoformat(),
-            'time_range': {
-                'start': start_date.isoformat(),
-                'end': end_date.isoformat()
-            },
-            'target_days_back': days_back,
-            'asf_results': {
-                'found': len(asf_results),
-                'selected': len(target_scenes),
-                'downloaded': sum(asf_downloads)
-            },
-            'sentinel_hub_results': {
-                'found': len(sh_results),
-                'processed': sum(sh_downloads)
-            },
-            'total_files': sum(asf_downloads) + sum(sh_downloads),
-            'selected_scenes': [scene['granule_name'] for scene in target_scenes]
-        }
-        
-        # Save summary
-        summary_path = self.data_dir / f"pipeline_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        async with aiofiles.open(summary_path, 'w') as f:
-            await f.write(json.dumps(summary, indent=2))
-        
-        logger.info(f"\n{'='*60}")
-        logger.info(f"PIPELINE EXECUTION COMPLETED")
-        logger.info(f"Selected scenes: {[scene['granule_name'] for scene in target_scenes]}")
-        logger.info(f"Summary: {summary}")
-        logger.info(f"{'='*60}")
-        return summary
+        logger.info(f"Prefetching ASF search for the run due at {end_date}")
+        task = asyncio.create_task(self.search_asf_data(start_date, end_date))
+        self._prefetch = (days_back, start_date, end_date, task)
 
     def schedule_pipeline(self, interval_hours: int = 24):
         """Schedule pipeline to run at regular intervals"""
         logger.info(f"Scheduling pipeline to run every {interval_hours} hours")
         
         async def scheduled_run():
+            # Runs are pinned to a fixed grid of loop.time() deadlines so
+            # pipeline runtime doesn't push every later run back
+            loop = asyncio.get_running_loop()
+            interval = interval_hours * 3600
+            next_tick = loop.time()
+            failures = 0
             while True:
                 try:
                     await self.run_pipeline()
-                    await asyncio.sleep(interval_hours * 3600)
+                    failures = 0
                 except Exception as e:
+                    failures += 1
                     logger.error(f"Scheduled pipeline error: {e}")
-                    await asyncio.sleep(3600)  # Wait 1 hour before retry
+                
+                if failures:
+                    # Retry off-grid with exponential backoff, capped at one interval
+                    delay = min(SCHEDULE_RETRY_DELAY * 2 ** (failures - 1), interval)
+                    logger.info(f"Retrying in {delay / 60:.0f} minutes")
+                    await asyncio.sleep(delay)
+                    continue
+                
+                next_tick += interval
+                now = loop.time()
+                if next_tick <= now:
+                    missed = int((now - next_tick) // interval) + 1
+                    next_tick += missed * interval
+                    logger.warning(f"Skipping {missed} scheduled run(s) that were missed")
+                
+                # Start the next run's catalog search shortly before its deadline
+                # so the result is ready when the run begins
+                if next_tick - now > PREFETCH_LEAD_TIME:
+                    await asyncio.sleep(next_tick - now - PREFETCH_LEAD_TIME)
+                    self._start_prefetch(next_tick - loop.time())
+                await asyncio.sleep(max(0.0, next_tick - loop.time()))
         
         return scheduled_run()
 
@@ -492,4 +1007,15 @@ async def main():
         await pipeline.run_pipeline(args.days_back)
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Optional: uvloop's libuv-based event loop (not available on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        if hasattr(asyncio, 'Runner'):  # Python 3.11+
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(main())
+        else:
+            uvloop.install()
+            asyncio.run(main())
\ No newline at end of file
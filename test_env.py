@@ -4,6 +4,8 @@ Test environment variable loading
 """
 
 import os
+import re
+import mmap
 from pathlib import Path
 
 # Try to load .env file manually
@@ -11,22 +13,28 @@ env_path = Path('.env')
 print(f"Looking for .env file at: {env_path.absolute()}")
 print(f".env file exists: {env_path.exists()}")
 
-if env_path.exists():
+# KEY=value lines; comments and blank lines never match
+_ENV_RE = re.compile(rb'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.M)
+
+# mmap() rejects empty files
+if env_path.exists() and env_path.stat().st_size:
     print(f"\n.env file contents:")
-    with open(env_path) as f:
-        for i, line in enumerate(f, 1):
-            if line.strip() and not line.strip().startswith('#'):
-                if '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    # Hide sensitive values
-                    if 'TOKEN' in key or 'SECRET' in key or 'PASSWORD' in key:
-                        display_value = value[:10] + "..." if len(value) > 10 else value
-                    else:
-                        display_value = value
-                    print(f"  Line {i}: {key}={display_value}")
-                    
-                    # Set in environment
-                    os.environ[key] = value
+    with open(env_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line_no, last = 1, 0
+        for match in _ENV_RE.finditer(mm):
+            line_no += mm[last:match.start()].count(b'\n')
+            last = match.start()
+            key = match.group(1).decode()
+            value = match.group(2).decode()
+            # Hide sensitive values
+            if 'TOKEN' in key or 'SECRET' in key or 'PASSWORD' in key:
+                display_value = value[:10] + "..." if len(value) > 10 else value
+            else:
+                display_value = value
+            print(f"  Line {line_no}: {key}={display_value}")
+            
+            # Set in environment
+            os.environ[key] = value
 
 # Test environment variables
 print(f"\nEnvironment variables:")
@@ -41,7 +49,8 @@ if token:
     print(f"EDL_TOKEN length: {len(token)} characters")
 
 # Check if token looks valid (JWT format)
-if token and token.count('.') == 2:
+# A JWT's two separators sit in its short header/payload, so only scan the start
+if token and token.count('.', 0, 4096) == 2:
     print("✅ Token appears to be valid JWT format")
 else:
     print("❌ Token does not appear to be valid JWT format")
\ No newline at end of file